@@ -0,0 +1,81 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import unmute.openai_realtime_api_events as ora
+import unmute.recorder
+from unmute.recorder import SAVE_EVERY_N_EVENTS, Recorder, RecorderEvent
+
+
+def make_event(i: int) -> ora.ResponseTextDelta:
+    return ora.ResponseTextDelta(delta=f"word{i}")
+
+
+def read_events(path: Path) -> list[RecorderEvent]:
+    with path.open() as f:
+        return [RecorderEvent.model_validate_json(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_flush_every_n_events(tmp_path: Path):
+    recorder = Recorder(tmp_path)
+
+    for i in range(SAVE_EVERY_N_EVENTS - 1):
+        await recorder.add_event("server", make_event(i))
+    assert not recorder.path.exists()
+
+    await recorder.add_event("server", make_event(SAVE_EVERY_N_EVENTS - 1))
+    assert recorder.pending_lines == []
+
+    await recorder.shutdown()
+    events = read_events(recorder.path)
+    assert len(events) == SAVE_EVERY_N_EVENTS
+    assert [e.data.delta for e in events] == [  # type: ignore
+        f"word{i}" for i in range(SAVE_EVERY_N_EVENTS)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_remainder(tmp_path: Path):
+    recorder = Recorder(tmp_path)
+
+    await recorder.add_event("client", make_event(0))
+    await recorder.add_event("server", make_event(1))
+    await recorder.shutdown()
+
+    events = read_events(recorder.path)
+    assert [e.event_sender for e in events] == ["client", "server"]
+
+    # Events after shutdown are ignored.
+    await recorder.add_event("server", make_event(2))
+    assert recorder.pending_lines == []
+
+
+@pytest.mark.asyncio
+async def test_flush_partial_batch_after_max_age(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(unmute.recorder, "SAVE_MAX_AGE_SEC", 0.05)
+    recorder = Recorder(tmp_path)
+
+    # No further events arrive, the partial batch should still get written.
+    await recorder.add_event("server", make_event(0))
+    await asyncio.sleep(0.5)
+
+    assert recorder.pending_lines == []
+    assert len(read_events(recorder.path)) == 1
+    await recorder.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_without_consent_deletes_recording(tmp_path: Path):
+    recorder = Recorder(tmp_path)
+
+    for i in range(SAVE_EVERY_N_EVENTS + 1):
+        await recorder.add_event("server", make_event(i))
+    assert recorder.path.exists()
+
+    await recorder.shutdown(keep_recording=False)
+    assert not recorder.path.exists()
+    assert list(tmp_path.iterdir()) == []
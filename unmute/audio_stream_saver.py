@@ -47,11 +47,8 @@ class AudioStreamSaver:
                     output_path.stem + f"_{self.n_saves_done + 1}"
                 )
 
-            sphn.write_wav(
-                output_path,
-                np.concatenate(self.buffer).astype(np.float32),
-                SAMPLE_RATE,
-            )
+            # The chunks are checked to be float32 in add(), so no need to convert
+            sphn.write_wav(output_path, np.concatenate(self.buffer), SAMPLE_RATE)
             self.n_saves_done += 1
             self.buffer.clear()
             logger.info(f"Saved audio to {output_path}")
@@ -2,11 +2,13 @@ import asyncio
 import base64
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from functools import cache, partial
 from typing import Annotated
 
+import httpx
 import numpy as np
-import requests
 import sphn
 from fastapi import (
     FastAPI,
@@ -48,7 +50,7 @@ from unmute.kyutai_constants import (
 )
 from unmute.service_discovery import async_ttl_cached
 from unmute.timer import Stopwatch
-from unmute.tts.voice_cloning import clone_voice
+from unmute.tts.voice_cloning import fetch_voice_embedding, register_voice_embedding
 from unmute.tts.voice_donation import (
     VoiceDonationSubmission,
     generate_verification,
@@ -57,7 +59,21 @@ from unmute.tts.voice_donation import (
 from unmute.tts.voices import VoiceList
 from unmute.unmute_handler import UnmuteHandler
 
-app = FastAPI()
+# Shared so that health checks reuse keep-alive connections to the services instead of
+# opening a new one every time. Created and closed by `lifespan()`.
+_health_check_client: httpx.AsyncClient | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _health_check_client
+    # Follow redirects like `requests` did, e.g. for an http->https redirecting proxy.
+    async with httpx.AsyncClient(timeout=2, follow_redirects=True) as client:
+        _health_check_client = client
+        yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -111,17 +127,15 @@ def _ws_to_http(ws_url: str) -> str:
     return ws_url.replace("ws://", "http://").replace("wss://", "https://")
 
 
-def _check_server_status(server_url: str, headers: dict | None = None) -> bool:
+async def _check_server_status(server_url: str, headers: dict | None = None) -> bool:
     """Check if the server is up by sending a GET request."""
+    assert _health_check_client is not None
     try:
-        response = requests.get(
-            server_url,
-            timeout=2,
-            headers=headers or {},
-        )
+        response = await _health_check_client.get(server_url, headers=headers or {})
         logger.info(f"Response from {server_url}: {response}")
         return response.status_code == 200
-    except requests.exceptions.RequestException as e:
+    # InvalidURL is not an HTTPError, but a misconfigured URL means the server is down.
+    except (httpx.HTTPError, httpx.InvalidURL) as e:
         logger.info(f"Couldn't connect to {server_url}: {e}")
         return False
 
@@ -153,18 +167,13 @@ async def _get_health(
 ):  # dummy param _none because caching function expects a single param as cache key.
     async with asyncio.TaskGroup() as tg:
         tts_up = tg.create_task(
-            asyncio.to_thread(
-                _check_server_status, _ws_to_http(TTS_SERVER) + "/api/build_info"
-            )
+            _check_server_status(_ws_to_http(TTS_SERVER) + "/api/build_info")
         )
         stt_up = tg.create_task(
-            asyncio.to_thread(
-                _check_server_status, _ws_to_http(STT_SERVER) + "/api/build_info"
-            )
+            _check_server_status(_ws_to_http(STT_SERVER) + "/api/build_info")
         )
         llm_up = tg.create_task(
-            asyncio.to_thread(
-                _check_server_status,
+            _check_server_status(
                 _ws_to_http(LLM_SERVER) + "/v1/models",
                 # The default vLLM server doesn't use auth, but this is needed if you
                 # use OpenAI or another LLM server.
@@ -172,10 +181,7 @@ async def _get_health(
             )
         )
         voice_cloning_up = tg.create_task(
-            asyncio.to_thread(
-                _check_server_status,
-                _ws_to_http(VOICE_CLONING_SERVER) + "/api/build_info",
-            )
+            _check_server_status(_ws_to_http(VOICE_CLONING_SERVER) + "/api/build_info")
         )
         tts_up_res = await tts_up
         stt_up_res = await stt_up
@@ -243,7 +249,10 @@ async def post_voices(file: UploadFile):
 
     Make sure the maximum file size is configured in uvicorn.
     """
-    name = clone_voice(file.file.read())
+    # The HTTP call is blocking, so run it in a thread so that it doesn't stall the
+    # WebSocket sessions. The cache is not thread-safe, so register on the loop.
+    embedding = await asyncio.to_thread(fetch_voice_embedding, await file.read())
+    name = register_voice_embedding(embedding)
     return {"name": name}
 
 
@@ -267,7 +276,7 @@ async def post_voice_donation(
     metadata: str = Form(...),
 ):
     """Finish a voice donation."""
-    file_bytes = file.file.read()
+    file_bytes = await file.read()
 
     try:
         metadata_parsed = VoiceDonationSubmission(**json.loads(metadata))
@@ -280,7 +289,7 @@ async def post_voice_donation(
         ) from e
 
     try:
-        submit_voice_donation(metadata_parsed, file_bytes)
+        await submit_voice_donation(metadata_parsed, file_bytes)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -388,17 +397,33 @@ async def _run_route(websocket: WebSocket, handler: UnmuteHandler):
         return
 
     emit_queue: asyncio.Queue[ora.ServerEvent] = asyncio.Queue()
+    # Give the Opus decoder and encoder a dedicated thread each, so that per-frame
+    # codec work doesn't queue behind other jobs in the shared default executor. This
+    # costs two extra OS threads per session. Calls were already ordered before, since
+    # each one is awaited before the next is submitted.
+    opus_reader_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="opus_reader"
+    )
+    opus_writer_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="opus_writer"
+    )
     try:
         async with asyncio.TaskGroup() as tg:
             tg.create_task(
-                receive_loop(websocket, handler, emit_queue), name="receive_loop()"
+                receive_loop(websocket, handler, emit_queue, opus_reader_executor),
+                name="receive_loop()",
             )
             tg.create_task(
-                emit_loop(websocket, handler, emit_queue), name="emit_loop()"
+                emit_loop(websocket, handler, emit_queue, opus_writer_executor),
+                name="emit_loop()",
             )
             tg.create_task(handler.quest_manager.wait(), name="quest_manager.wait()")
-            tg.create_task(debug_running_tasks(), name="debug_running_tasks()")
+            if logger.isEnabledFor(logging.DEBUG):
+                # It only logs at debug level, don't wake up for nothing otherwise.
+                tg.create_task(debug_running_tasks(), name="debug_running_tasks()")
     finally:
+        opus_reader_executor.shutdown(wait=False)
+        opus_writer_executor.shutdown(wait=False)
         await handler.cleanup()
         logger.info("websocket_route() finished")
 
@@ -407,13 +432,16 @@ async def receive_loop(
     websocket: WebSocket,
     handler: UnmuteHandler,
     emit_queue: asyncio.Queue[ora.ServerEvent],
+    opus_executor: ThreadPoolExecutor,
 ):
     """Receive messages from the WebSocket.
 
-    Can decide to send messages via `emit_queue`.
+    Can decide to send messages via `emit_queue`. The Opus decoder runs on
+    `opus_executor`.
     """
     opus_reader = sphn.OpusStreamReader(SAMPLE_RATE)
     wait_for_first_opus = True
+    loop = asyncio.get_running_loop()
     while True:
         try:
             message_raw = await websocket.receive_text()
@@ -467,7 +495,9 @@ async def receive_loop(
                     wait_for_first_opus = False
                 else:
                     continue
-            pcm = await asyncio.to_thread(opus_reader.append_bytes, opus_bytes)
+            pcm = await loop.run_in_executor(
+                opus_executor, opus_reader.append_bytes, opus_bytes
+            )
 
             message_to_record = ora.UnmuteInputAudioBufferAppendAnonymized(
                 number_of_samples=pcm.size,
@@ -504,20 +534,27 @@ class EmitDebugLogger:
             self.last_emitted_type = to_emit.type
 
         if self.last_emitted_n == 1:
-            logger.debug(f"Emitting: {to_emit.type}")
+            logger.debug("Emitting: %s", to_emit.type)
         else:
-            logger.debug(f"Emitting ({self.last_emitted_n}): {self.last_emitted_type}")
+            logger.debug(
+                "Emitting (%d): %s", self.last_emitted_n, self.last_emitted_type
+            )
 
 
 async def emit_loop(
     websocket: WebSocket,
     handler: UnmuteHandler,
     emit_queue: asyncio.Queue[ora.ServerEvent],
+    opus_executor: ThreadPoolExecutor,
 ):
-    """Send messages to the WebSocket."""
+    """Send messages to the WebSocket.
+
+    The Opus encoder runs on `opus_executor`.
+    """
     emit_debug_logger = EmitDebugLogger()
 
     opus_writer = sphn.OpusStreamWriter(SAMPLE_RATE)
+    loop = asyncio.get_running_loop()
 
     while True:
         if (
@@ -534,6 +571,20 @@ async def emit_loop(
 
             if emitted_by_handler is None:
                 continue
+            # Audio frames are by far the most common, so check for them first.
+            elif isinstance(emitted_by_handler, tuple):
+                _sr, audio = emitted_by_handler
+                audio = audio_to_float32(audio)
+                opus_bytes = await loop.run_in_executor(
+                    opus_executor, opus_writer.append_pcm, audio
+                )
+                # Due to buffering/chunking, Opus doesn't necessarily output something on every PCM added
+                if opus_bytes:
+                    to_emit = ora.ResponseAudioDelta(
+                        delta=base64.b64encode(opus_bytes).decode("utf-8"),
+                    )
+                else:
+                    continue
             elif isinstance(emitted_by_handler, AdditionalOutputs):
                 assert len(emitted_by_handler.args) == 1
                 to_emit = ora.UnmuteAdditionalOutputs(
@@ -543,19 +594,8 @@ async def emit_loop(
                 # Close here explicitly so that the receive loop stops too
                 await websocket.close()
                 break
-            elif isinstance(emitted_by_handler, ora.ServerEvent):
-                to_emit = emitted_by_handler
             else:
-                _sr, audio = emitted_by_handler
-                audio = audio_to_float32(audio)
-                opus_bytes = await asyncio.to_thread(opus_writer.append_pcm, audio)
-                # Due to buffering/chunking, Opus doesn't necessarily output something on every PCM added
-                if opus_bytes:
-                    to_emit = ora.ResponseAudioDelta(
-                        delta=base64.b64encode(opus_bytes).decode("utf-8"),
-                    )
-                else:
-                    continue
+                to_emit = emitted_by_handler
 
         emit_debug_logger.on_emit(to_emit)
 
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +15,11 @@ logger = logging.getLogger(__name__)
 
 EventSender = Literal["client", "server"]
 
+# Events are buffered and written out in batches to avoid one file write per event.
+SAVE_EVERY_N_EVENTS = 100
+# ...but don't let a partial batch sit in memory for longer than this.
+SAVE_MAX_AGE_SEC = 5.0
+
 
 class RecorderEvent(BaseModel):
     timestamp_wall: float
@@ -31,21 +38,69 @@ class Recorder:
         recordings_dir.mkdir(exist_ok=True)
         # We use aiofiles to avoid blocking the event loop when writing to the file.
         self.opened_file = None
+        self.pending_lines: list[str] = []
+        # Armed when the first event of a batch is buffered.
+        self.flush_timer: asyncio.TimerHandle | None = None
+        self.background_flushes: set[asyncio.Task[None]] = set()
+        # add_event() is called from both the receive and the emit loop, so flushes
+        # can overlap. The lock makes sure the file is opened once and that batches
+        # are written in order.
+        self.flush_lock = asyncio.Lock()
+        self.closed = False
 
     async def add_event(self, event_sender: EventSender, data: ora.Event):
         """If the recorder is not actually running, the event will be ignored."""
-        if self.opened_file is None:
-            self.opened_file = await aiofiles.open(self.path, "a")
+        if self.closed:
+            return
 
-        await self.opened_file.write(
-            RecorderEvent(
-                timestamp_wall=datetime.now().timestamp(),
+        # The event has already been validated, so skip re-validating it here.
+        self.pending_lines.append(
+            RecorderEvent.model_construct(
+                timestamp_wall=time.time(),
                 event_sender=event_sender,
                 data=data,
             ).model_dump_json()
             + "\n"
         )
 
+        if len(self.pending_lines) >= SAVE_EVERY_N_EVENTS:
+            await self.flush()
+        elif self.flush_timer is None:
+            self.flush_timer = asyncio.get_running_loop().call_later(
+                SAVE_MAX_AGE_SEC, self._flush_in_background
+            )
+
+    def _flush_in_background(self):
+        self.flush_timer = None
+        task = asyncio.create_task(self._flush_and_log_errors())
+        # Keep a reference so that the task doesn't get garbage collected.
+        self.background_flushes.add(task)
+        task.add_done_callback(self.background_flushes.discard)
+
+    async def _flush_and_log_errors(self):
+        # Nobody awaits the background flush, so errors would otherwise go unnoticed.
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception(f"Failed to write events to recording {self.path}")
+
+    async def flush(self):
+        """Write the buffered events to the file in a single write."""
+        # Take the lines before awaiting anything so that they're not written twice.
+        lines, self.pending_lines = self.pending_lines, []
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        if not lines:
+            return
+
+        async with self.flush_lock:
+            if self.opened_file is None:
+                self.opened_file = await aiofiles.open(self.path, "a")
+
+            await self.opened_file.write("".join(lines))
+            await self.opened_file.flush()
+
     async def shutdown(self, keep_recording: bool = True):
         """Flush any remaining events to the file and close the recorder.
 
@@ -53,7 +108,14 @@ class Recorder:
         This is because we get the user consent after we've already started recording,
         so if the user doesn't consent, we delete the file afterwards.
         """
-        if self.opened_file is not None:
+        self.closed = True
+        if not keep_recording:
+            self.pending_lines = []
+        await self.flush()
+
+        async with self.flush_lock:
+            if self.opened_file is None:
+                return
             await self.opened_file.close()
             if keep_recording:
                 logger.info(f"Recording stored into {self.path}.")
@@ -60,7 +60,13 @@ async def send_messages(websocket: websockets.ClientConnection, audio_path: Path
 
 async def receive_messages(websocket: websockets.ClientConnection):
     buffer = []
-    transcript = ""
+    # Print the transcript in one go rather than once per delta.
+    transcript_deltas: list[str] = []
+
+    def print_transcript():
+        if transcript_deltas:
+            print("".join(transcript_deltas))
+            transcript_deltas.clear()
 
     try:
         async for message in websocket:
@@ -69,15 +75,26 @@ async def receive_messages(websocket: websockets.ClientConnection):
                 base64_audio = message["delta"]
                 binary_audio_data = base64.b64decode(base64_audio)
                 buffer.append(binary_audio_data)
+            # Unmute sends the text as `response.text.*`, OpenAI as
+            # `response.audio_transcript.*`.
+            elif message["type"] in (
+                "response.text.delta",
+                "response.audio_transcript.delta",
+            ):
+                transcript_deltas.append(message["delta"])
+            elif message["type"] in (
+                "response.text.done",
+                "response.audio_transcript.done",
+            ):
+                print_transcript()
             elif message["type"] == "response.audio.done":
+                print_transcript()
                 print("Received `response.audio.done` message.")
                 break
-            elif message["type"] == "response.audio_transcript.delta":
-                transcript += message["delta"]
-                print(message["delta"], end="", flush=True)
             else:
                 print(f"Received message: {message}")
     except websockets.ConnectionClosed:
+        print_transcript()
         print("Connection closed while receiving messages.")
 
     # save and play using pydub
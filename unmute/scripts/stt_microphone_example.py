@@ -15,7 +15,7 @@ except ImportError as e:
     ) from e
 import tqdm
 
-from unmute.kyutai_constants import SAMPLES_PER_FRAME
+from unmute.kyutai_constants import SAMPLE_RATE, SAMPLES_PER_FRAME
 from unmute.stt.speech_to_text import (
     SpeechToText,
     STTMarkerMessage,
@@ -42,16 +42,21 @@ async def main():
     duration_sec = 30
 
     receive_task = asyncio.create_task(receive_loop(stt))
+    loop = asyncio.get_running_loop()
 
     def callback(indata: np.ndarray, frames: int, time: Any, status: sd.CallbackFlags):
+        # Runs in PortAudio's thread, so hand the chunk over to the event loop
+        # instead of touching the asyncio.Queue directly.
         mono_audio = indata[:, 0]
-        audio_queue.put_nowait(mono_audio.copy())
+        loop.call_soon_threadsafe(audio_queue.put_nowait, mono_audio.copy())
 
     start_time = asyncio.get_event_loop().time()
 
-    audio_buffer = np.zeros((0,), dtype=np.float32)
-
-    with sd.InputStream(callback=callback, blocksize=1024, samplerate=24000):
+    # Ask PortAudio for blocks of exactly one STT frame so that the chunks can be
+    # sent as-is, without re-buffering and slicing them on our side.
+    with sd.InputStream(
+        callback=callback, blocksize=SAMPLES_PER_FRAME, samplerate=SAMPLE_RATE
+    ):
         pbar = tqdm.tqdm(total=duration_sec, desc="Recording", unit="s")
         while asyncio.get_event_loop().time() - start_time < duration_sec:
             try:
@@ -65,13 +70,8 @@ async def main():
             # Updating this is a bit annoying
             # pbar.update(audio_chunk.shape[0] / 24000)
 
-            audio_buffer = np.concatenate((audio_buffer, audio_chunk), axis=0)
-            while audio_buffer.shape[0] > SAMPLES_PER_FRAME:
-                audio_chunk = audio_buffer[:SAMPLES_PER_FRAME]
-                audio_buffer = audio_buffer[SAMPLES_PER_FRAME:]
-
-                await stt.send_marker(int(asyncio.get_event_loop().time() * 1000))
-                await stt.send_audio(audio_chunk)
+            await stt.send_marker(int(asyncio.get_event_loop().time() * 1000))
+            await stt.send_audio(audio_chunk)
 
     receive_task.cancel()
     print(f"Quit after {duration_sec} seconds.")
@@ -130,7 +130,10 @@ class SpeechToText(ServiceWithStartup):
     async def start_up(self):
         logger.info(f"Connecting to STT {self.stt_instance}...")
         self.websocket = await websockets.connect(
-            self.stt_instance + SPEECH_TO_TEXT_PATH, additional_headers=HEADERS
+            self.stt_instance + SPEECH_TO_TEXT_PATH,
+            additional_headers=HEADERS,
+            # Deflating every frame adds CPU time and latency to a real-time stream
+            compression=None,
         )
         logger.info("Connected to STT")
 
@@ -186,7 +189,9 @@ class SpeechToText(ServiceWithStartup):
         try:
             async for message_bytes in self.websocket:
                 data = msgpack.unpackb(message_bytes)  # type: ignore
-                logger.debug(f"{my_id} {self.pause_prediction.value} got {data}")
+                # Lazy formatting: this runs for every STT message, and formatting
+                # `data` is wasted work unless debug logging is on.
+                logger.debug("%s %s got %s", my_id, self.pause_prediction.value, data)
                 message: STTMessage = STTMessageAdapter.validate_python(data)
 
                 match message:
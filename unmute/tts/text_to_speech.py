@@ -209,6 +209,7 @@ class TextToSpeech(ServiceWithStartup):
         self.websocket = await websockets.connect(
             url,
             additional_headers=HEADERS,
+            compression=None,
         )
         logger.debug("Connected to TTS")
 
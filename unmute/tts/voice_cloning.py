@@ -12,18 +12,20 @@ logger = logging.getLogger(__name__)
 voice_embeddings_cache = get_cache(prefix="voice", ttl_seconds=60 * 60 * 1)  # 1 hour
 
 
-def clone_voice(audio_data: bytes) -> str:
-    # Generate a unique voice name
-    voice_name = "custom:" + str(uuid.uuid4())
-
-    # Call the voice cloning server
+def fetch_voice_embedding(audio_data: bytes) -> bytes:
+    """Call the voice cloning server. Blocking, but doesn't touch the cache."""
     response = requests.post(
         f"{VOICE_CLONING_SERVER}/api/voice",
         data=audio_data,
         headers={"Content-Type": "application/octet-stream"},
     )
     response.raise_for_status()
-    msgpack_data = response.content
+    return response.content
+
+
+def register_voice_embedding(msgpack_data: bytes) -> str:
+    # Generate a unique voice name
+    voice_name = "custom:" + str(uuid.uuid4())
 
     logger.info(f"Received voice embedding of size: {len(msgpack_data)} bytes")
 
@@ -31,3 +33,7 @@ def clone_voice(audio_data: bytes) -> str:
     voice_embeddings_cache.cleanup()
 
     return voice_name
+
+
+def clone_voice(audio_data: bytes) -> str:
+    return register_voice_embedding(fetch_voice_embedding(audio_data))
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import functools
 import logging
@@ -77,7 +78,15 @@ class VoiceDonationMetadata(BaseModel):
     timestamp_str: str  # For human readability
 
 
-def submit_voice_donation(
+def _write_donation_files(
+    audio_file_path: Path, audio_file: bytes, metadata_path: Path, metadata_json: str
+) -> None:
+    VOICE_DONATION_DIR.mkdir(parents=True, exist_ok=True)
+    audio_file_path.write_bytes(audio_file)
+    metadata_path.write_text(metadata_json)
+
+
+async def submit_voice_donation(
     submission: VoiceDonationSubmission, audio_file: bytes
 ) -> None:
     file_size_mb = len(audio_file) / (1024 * 1024)
@@ -114,10 +123,12 @@ def submit_voice_donation(
             "Please request a new verification."
         )
 
-    VOICE_DONATION_DIR.mkdir(parents=True, exist_ok=True)
-    audio_file_path = VOICE_DONATION_DIR / f"{submission.verification_id}.wav"
-    audio_file_path.write_bytes(audio_file)
+    # Claim the single-use verification before the first await, so that concurrent
+    # submissions with the same ID can't both get past the check above.
+    voice_donation_verification_cache.delete(str(submission.verification_id))
+    voice_donation_verification_cache.cleanup()
 
+    audio_file_path = VOICE_DONATION_DIR / f"{submission.verification_id}.wav"
     now = datetime.datetime.now().astimezone()
     metadata = VoiceDonationMetadata(
         submission=submission,
@@ -126,10 +137,21 @@ def submit_voice_donation(
         timestamp_str=now.isoformat(),
     )
     metadata_path = VOICE_DONATION_DIR / f"{submission.verification_id}.json"
-    metadata_path.write_text(metadata.model_dump_json(indent=2))
-
-    voice_donation_verification_cache.delete(str(submission.verification_id))
-    voice_donation_verification_cache.cleanup()
+    # Only the file writes go to a thread, the cache is not thread-safe.
+    try:
+        await asyncio.to_thread(
+            _write_donation_files,
+            audio_file_path,
+            audio_file,
+            metadata_path,
+            metadata.model_dump_json(indent=2),
+        )
+    except Exception:
+        # Give the verification back so that the user can retry.
+        voice_donation_verification_cache.set(
+            str(submission.verification_id), verification_raw
+        )
+        raise
 
     logger.info(
         f"Received voice donation with id {submission.verification_id}, "
@@ -66,6 +66,11 @@ UNINTERRUPTIBLE_BY_VAD_TIME_SEC = 3
 
 logger = getLogger(__name__)
 
+# Shared between all uses: the consumers (Opus encoder, STT) only read it, and making it
+# read-only ensures nobody modifies it by accident.
+SILENCE_FRAME = np.zeros(SAMPLES_PER_FRAME, dtype=np.float32)
+SILENCE_FRAME.setflags(write=False)
+
 HandlerOutput = (
     tuple[int, np.ndarray] | AdditionalOutputs | ora.ServerEvent | CloseStream
 )
@@ -296,7 +301,10 @@ class UnmuteHandler(AsyncStreamHandler):
         self.debug_plot_data.append(
             {
                 "t": self.audio_received_sec(),
-                "amplitude": float(np.sqrt((float_audio**2).mean())),
+                # np.dot avoids allocating a squared copy of the frame
+                "amplitude": float(
+                    np.sqrt(np.dot(float_audio, float_audio) / float_audio.size)
+                ),
                 "pause_prediction": stt.pause_prediction.value,
             }
         )
@@ -346,9 +354,8 @@ class UnmuteHandler(AsyncStreamHandler):
                 num_frames = (
                     int(math.ceil(stt.delay_sec / FRAME_TIME_SEC)) + 1
                 )  # some safety margin.
-                zero = np.zeros(SAMPLES_PER_FRAME, dtype=np.float32)
                 for _ in range(num_frames):
-                    await stt.send_audio(zero)
+                    await stt.send_audio(SILENCE_FRAME)
             elif (
                 self.chatbot.conversation_state() == "bot_speaking"
                 and stt.pause_prediction.value < 0.4
@@ -559,9 +566,7 @@ class UnmuteHandler(AsyncStreamHandler):
 
         # Push some silence to flush the Opus state.
         # Not sure that this is actually needed.
-        await output_queue.put(
-            (SAMPLE_RATE, np.zeros(SAMPLES_PER_FRAME, dtype=np.float32))
-        )
+        await output_queue.put((SAMPLE_RATE, SILENCE_FRAME))
 
         message = self.chatbot.last_message("assistant")
         if message is None:
@@ -597,9 +602,7 @@ class UnmuteHandler(AsyncStreamHandler):
 
         # Push some silence to flush the Opus state.
         # Not sure that this is actually needed.
-        await self.output_queue.put(
-            (SAMPLE_RATE, np.zeros(SAMPLES_PER_FRAME, dtype=np.float32))
-        )
+        await self.output_queue.put((SAMPLE_RATE, SILENCE_FRAME))
 
         await self.output_queue.put(ora.UnmuteInterruptedByVAD())
 